@@ -0,0 +1,273 @@
+# load_test.py
+#
+# Eşzamanlı analist oturumlarını simüle eden yerel yük testi.
+# Kullanım (solar_generation_forecast klasöründen):
+#   python load_test.py --sessions 40 --concurrency 8
+#
+# Bellek ölçümü: Linux'ta anlık RSS /proc/self/statm'den örneklenir ve o anda
+# açık oturum sayısına bölünür. /proc yoksa (macOS) tepe RSS (resource.ru_maxrss,
+# macOS'ta byte, Linux'ta KB) eşzamanlılık sayısına bölünür; Windows'ta bellek raporlanmaz.
+# Her iki değer de oturum başına bir tahmindir.
+
+import argparse
+import gc
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+APP_DIR = Path(__file__).parent
+APP_SCRIPT = APP_DIR / "main.py"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+PERCENTILES = [50, 90, 95, 99]
+RSS_SAMPLE_INTERVAL = 0.05
+
+
+def build_synthetic_workbook(seed: int, years: int = 1, with_price: bool = True):
+    """
+    Şablonla aynı sayfalara sahip rastgele bir Excel dosyası üretir ve byte olarak döndürür.
+    """
+    rng = np.random.default_rng(seed)
+    datetimes = pd.date_range("2024-01-01", periods=years * 8760, freq="h")
+
+    daylight = np.clip(np.sin((datetimes.hour.to_numpy() - 6) / 12 * np.pi), 0, None)
+    seasonal = 1 + 0.3 * np.sin((datetimes.dayofyear.to_numpy() - 80) / 365 * 2 * np.pi)
+    installed_power = rng.uniform(10, 50)
+    generation = installed_power * daylight * seasonal * rng.uniform(0.6, 1.0, len(datetimes))
+
+    generation_df = pd.DataFrame({"Datetime": datetimes, "Generation(MWh)": generation.round(3)})
+    generation_df["Datetime"] = generation_df["Datetime"].dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    monthly_totals = generation_df.groupby(datetimes.month)["Generation(MWh)"].sum().to_numpy() / years
+    monthly_df = pd.DataFrame({
+        "Month": range(1, 13),
+        "Monthly_Total_Generation_MWh": monthly_totals.round(2),
+        "Installed_Power_MW": [round(installed_power, 2)] + [None] * 11,
+        "Licence_Power_MW": [round(installed_power * 0.85, 2)] + [None] * 11,
+    })
+
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer) as writer:
+        generation_df.to_excel(writer, sheet_name="Generation", index=False)
+        monthly_df.to_excel(writer, sheet_name="Monthly_Total_Generation", index=False)
+        if with_price:
+            price_df = pd.DataFrame({"Hour": range(24)})
+            for month in range(1, 13):
+                price_df[str(month)] = rng.uniform(50, 150, 24).round(2)
+            price_df.to_excel(writer, sheet_name="Price", index=False)
+    return buffer.getvalue()
+
+
+def timed_run(app: AppTest, step: str, timings: list):
+    start = time.perf_counter()
+    app.run()
+    timings.append({"Step": step, "Latency (s)": time.perf_counter() - start})
+    if app.exception:
+        raise RuntimeError(f"{step}: {app.exception[0].value}")
+
+
+def simulate_session(session_id: int, workbook: bytes, timeout: float, monitor=None):
+    """
+    Bir analistin InputPage ve InputDataAnalysisPage üzerindeki tipik akışı:
+    sayfayı aç, dosya yükle, zaman sütunu seçip grafiği çiz, lisans gücünü değiştir.
+    """
+    timings = []
+    if monitor:
+        monitor.session_started()
+    try:
+        app = AppTest.from_file(str(APP_SCRIPT), default_timeout=timeout)
+        timed_run(app, "open", timings)
+
+        app.file_uploader[0].set_value((f"session_{session_id}.xlsx", workbook, XLSX_MIME))
+        timed_run(app, "upload", timings)
+
+        app.sidebar.selectbox[1].set_value("Datetime")
+        timed_run(app, "plot", timings)
+
+        licence_input = next(widget for widget in app.number_input if widget.label == "Lisans Gücü (MW)")
+        licence_input.set_value(licence_input.value - 1)
+        timed_run(app, "licence_change", timings)
+        error = None
+    except Exception as e:
+        error = str(e)
+    finally:
+        if monitor:
+            monitor.session_finished()
+
+    for timing in timings:
+        timing["Session"] = session_id
+    return timings, error
+
+
+def current_rss_mb():
+    """
+    Anlık RSS (MB). Yalnızca /proc olan sistemlerde (Linux) kullanılabilir, yoksa None.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_mb():
+    """
+    Tepe RSS (MB). resource modülü yalnızca Unix'te vardır; Windows'ta None döner.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss macOS'ta byte, Linux'ta KB cinsindendir
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+class LiveSessionMonitor:
+    """
+    Açık oturum sayısını tutar ve arka planda anlık RSS'i örnekler.
+    """
+
+    def __init__(self, baseline_rss_mb):
+        self.baseline_rss_mb = baseline_rss_mb
+        self.live_sessions = 0
+        self.max_live_sessions = 0
+        self.samples = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def session_started(self):
+        with self._lock:
+            self.live_sessions += 1
+            self.max_live_sessions = max(self.max_live_sessions, self.live_sessions)
+
+    def session_finished(self):
+        with self._lock:
+            self.live_sessions -= 1
+
+    def _sample(self):
+        while not self._stop.wait(RSS_SAMPLE_INTERVAL):
+            rss = current_rss_mb()
+            with self._lock:
+                live_sessions = self.live_sessions
+            if rss is not None and live_sessions:
+                self.samples.append((live_sessions, rss))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def memory_per_live_session_mb(self):
+        """
+        Örnek başına (RSS - başlangıç RSS) / açık oturum; örneklerin medyanı. Örnek yoksa None.
+        """
+        if self.baseline_rss_mb is None or not self.samples:
+            return None
+        live_sessions, rss = np.array(self.samples).T
+        return float(np.median((rss - self.baseline_rss_mb) / live_sessions))
+
+
+def summarize(timings_df: pd.DataFrame):
+    rows = []
+    for step, group in timings_df.groupby("Step", sort=False):
+        latencies = group["Latency (s)"].to_numpy()
+        row = {"Step": step, "Runs": len(latencies), "Mean (s)": latencies.mean()}
+        for percentile, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+            row[f"p{percentile} (s)"] = value
+        row["Max (s)"] = latencies.max()
+        rows.append(row)
+    return pd.DataFrame(rows).round(3)
+
+
+def run_load_test(sessions: int, concurrency: int, years: int, with_price: bool, timeout: float):
+    workbooks = [build_synthetic_workbook(seed, years, with_price) for seed in range(sessions)]
+
+    # Isınma: import ve ilk derleme maliyetleri ölçüme karışmasın
+    simulate_session(-1, workbooks[0], timeout)
+
+    gc.collect()
+    peak_before = peak_rss_mb()
+    start = time.perf_counter()
+    with LiveSessionMonitor(current_rss_mb()) as monitor, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(
+            simulate_session, range(sessions), workbooks, [timeout] * sessions, [monitor] * sessions
+        ))
+    elapsed = time.perf_counter() - start
+    peak_after = peak_rss_mb()
+
+    memory_per_session = monitor.memory_per_live_session_mb()
+    memory_source = "live RSS samples"
+    if memory_per_session is None and peak_before is not None:
+        # Aynı anda en fazla 'concurrency' oturum açık olabilir
+        memory_per_session = (peak_after - peak_before) / max(monitor.max_live_sessions, 1)
+        memory_source = "peak RSS growth"
+
+    timings = [timing for session_timings, _ in results for timing in session_timings]
+    errors = [error for _, error in results if error]
+    completed = sessions - len(errors)
+
+    overview = pd.DataFrame({
+        "Metric": [
+            "Sessions",
+            "Concurrency",
+            "Failed Sessions",
+            "Wall Time (s)",
+            "Throughput (sessions/s)",
+            "Throughput (script runs/s)",
+            "Max Live Sessions",
+            "Peak RSS (MB)",
+            f"Memory per Live Session (MB, estimate from {memory_source})",
+        ],
+        "Value": pd.Series(dtype=object, data=[
+            sessions,
+            concurrency,
+            len(errors),
+            round(elapsed, 2),
+            round(completed / elapsed, 3),
+            round(len(timings) / elapsed, 3),
+            monitor.max_live_sessions,
+            None if peak_after is None else round(peak_after, 1),
+            None if memory_per_session is None else round(memory_per_session, 2),
+        ]),
+    })
+    return overview, summarize(pd.DataFrame(timings)), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Streamlit app.")
+    parser.add_argument("--sessions", type=int, default=20, help="Total simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=4, help="Simultaneous sessions")
+    parser.add_argument("--years", type=int, default=1, help="Years of hourly data per synthetic workbook")
+    parser.add_argument("--no-price", action="store_true", help="Omit the optional Price sheet")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per script run timeout (s)")
+    args = parser.parse_args()
+
+    # Sayfalar 'inputs/...' yollarını çalışma klasörüne göre açar
+    os.chdir(APP_DIR)
+
+    overview, latency, errors = run_load_test(
+        args.sessions, args.concurrency, args.years, not args.no_price, args.timeout
+    )
+
+    print(overview.to_string(index=False))
+    print()
+    print(latency.to_string(index=False))
+    for error in errors:
+        print(f"🔴 {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 from pages.Data_Upload_and_Validation_Page import InputPage
 from pages.Data_Analysis import InputDataAnalysisPage
+from utils.pipeline import start_pipeline_run
+
+start_pipeline_run()
 
 page_Data_Upload_and_Validation = InputPage()
 page_Data_Upload_and_Validation.run()
@@ -0,0 +1,63 @@
+import streamlit as st
+
+from utils.pipeline import get_pipeline, show_pipeline_stats, start_pipeline_run
+from utils.session_inputs import get_forecast_inputs
+
+
+class ForecastingPage:
+    def __init__(self):
+        st.title("Forecasting")
+        self.check_data()
+
+    def check_data(self):
+        if not st.session_state.get("excel_data") or st.session_state.get("uploaded_bytes") is None:
+            st.error("❌ Gerekli veriler bulunamadı. Lütfen önce 'Data Upload and Validation' adımını tamamlayın.")
+            st.stop()
+
+    def show_generation_summary(self, summary_df):
+        st.subheader("📊 Yıllık Üretim Tahmini")
+        st.dataframe(summary_df.round(2), use_container_width=True)
+
+    def show_revenue(self, revenue_df):
+        st.subheader("💰 Yıllık Gelir")
+        st.dataframe(revenue_df.round(2), use_container_width=True)
+        st.line_chart(revenue_df.pivot(index="Year", columns="Scenario", values="Revenue"))
+
+    def run(self):
+        st.title("🔮 Generation Forecast")
+
+        if st.session_state["excel_data"].get("Generation") is None:
+            st.error("🔴 Missing sheet(s): Generation")
+            return
+
+        pipeline = get_pipeline()
+        values = {"uploaded_bytes": st.session_state["uploaded_bytes"], **get_forecast_inputs()}
+
+        try:
+            summary_df = pipeline.get("aggregate", values)
+        except (ValueError, KeyError, TypeError) as e:
+            st.error(f"🔴 Invalid Generation sheet: {e}")
+            return
+        self.show_generation_summary(summary_df)
+        st.session_state["forecast_summary"] = summary_df
+
+        try:
+            revenue_df = pipeline.get("revenue", values)
+        except (ValueError, KeyError, TypeError) as e:
+            st.error(f"🔴 Invalid Price sheet: {e}")
+            revenue_df = None
+        else:
+            if revenue_df is None:
+                st.info("ℹ️ 'Price' sayfası yüklenmediği için gelir hesaplanmadı.")
+            else:
+                self.show_revenue(revenue_df)
+        st.session_state["revenue"] = revenue_df
+
+        show_pipeline_stats()
+
+
+# Sayfa çalıştırma
+if __name__ == "__main__":
+    start_pipeline_run()
+    page = ForecastingPage()
+    page.run()
@@ -0,0 +1,68 @@
+import streamlit as st
+
+from utils.backtesting import ForecastBacktester
+from utils.session_inputs import get_forecast_inputs
+
+
+class BacktestPage:
+    def __init__(self):
+        st.title("Forecast Backtesting")
+        self.check_data()
+
+    def check_data(self):
+        if "excel_data" not in st.session_state or not st.session_state["excel_data"]:
+            st.error("❌ Gerekli veriler bulunamadı. Lütfen önce 'Data Upload and Validation' adımını tamamlayın.")
+            st.stop()
+
+    def sidebar_controls(self, year_count):
+        st.sidebar.subheader("🔁 Backtest Ayarları")
+        training_years = st.sidebar.number_input(
+            "Eğitim Penceresi (Yıl)", min_value=1, max_value=max(year_count - 1, 1), value=1, step=1
+        )
+        horizon_years = st.sidebar.number_input(
+            "Test Ufku (Yıl)", min_value=1, max_value=max(year_count - training_years, 1), value=1, step=1
+        )
+        return int(training_years), int(horizon_years)
+
+    def run(self):
+        st.title("🔁 Backtest: Forecast vs Actual")
+
+        generation_df = st.session_state["excel_data"].get("Generation")
+        if generation_df is None:
+            st.error("🔴 Missing sheet(s): Generation")
+            return
+
+        forecast_inputs = get_forecast_inputs()
+        backtester = ForecastBacktester(
+            generation_df,
+            capacity_factor=forecast_inputs["capacity_factor"],
+            consider_cf=forecast_inputs["consider_cf"],
+            installed_power_mw=forecast_inputs["installed_power_mw"],
+            yearly_degradation_rate=forecast_inputs["yearly_degradation_rate"],
+        )
+
+        if len(backtester.years) < 2:
+            st.warning("🟡 Backtest için en az iki yıllık saatlik üretim verisi gereklidir.")
+            return
+
+        training_years, horizon_years = self.sidebar_controls(len(backtester.years))
+
+        try:
+            metrics_df, monthly_error_df = backtester.run(training_years, horizon_years)
+        except ValueError as e:
+            st.error(f"🔴 {e}")
+            return
+
+        st.subheader("📊 Hata Metrikleri")
+        st.dataframe(metrics_df.round(2), use_container_width=True)
+
+        st.subheader("📆 Aylık Enerji Hatası (%)")
+        st.dataframe(monthly_error_df.round(2), use_container_width=True)
+
+        st.session_state["backtest_metrics"] = metrics_df
+
+
+# Sayfa çalıştırma
+if __name__ == "__main__":
+    page = BacktestPage()
+    page.run()
@@ -1,6 +1,6 @@
 
 import streamlit as st
-from utils.input_analysis import InputDataAnalyzer
+from utils.pipeline import get_pipeline, show_pipeline_stats, start_pipeline_run
 
 class InputDataAnalysisPage:
     def __init__(self):
@@ -9,7 +9,7 @@ class InputDataAnalysisPage:
         self.check_data()
 
     def check_data(self):
-        if "excel_data" not in st.session_state or not st.session_state["excel_data"]:
+        if not st.session_state.get("excel_data") or st.session_state.get("uploaded_bytes") is None:
             st.error("❌ Gerekli veriler bulunamadı. Lütfen önce 'Data Upload and Validation' adımını tamamlayın.")
             st.stop()
 
@@ -25,12 +25,12 @@ class InputDataAnalysisPage:
 
         return selected_key, datetime_col
 
-    def show_generation_metrics(self, analyzer, selected_key):
-        df = analyzer.data[selected_key]
+    def show_generation_metrics(self, pipeline, values):
+        df = st.session_state["excel_data"][values["selected_key"]]
         
         if "Generation(MWh)" not in df.columns:
             st.info("⚠️ Bu tabloda 'Generation(MWh)' sütunu bulunamadığı için üretim metrikleri hesaplanamadı.")
-            return
+            return None
 
         st.subheader("📊 Üretim Metrikleri")
         col1, col2 = st.columns(2)
@@ -39,8 +39,12 @@ class InputDataAnalysisPage:
         with col2:
             licence_power = st.number_input("Lisans Gücü (MW)", min_value=0.1, value=45.0)
 
-        metrics_df = analyzer.calculate_generation_metrics(df, installed_power, licence_power)
-        st.dataframe(metrics_df, use_container_width=True)
+        values["metrics_installed_power_mw"] = installed_power
+        values["metrics_licence_power_mw"] = licence_power
+
+        metrics = pipeline.get("metrics", values)
+        st.dataframe(metrics[0], use_container_width=True)
+        return metrics
 
 
     def run(self):
@@ -61,22 +65,40 @@ class InputDataAnalysisPage:
         # analyzer.plot_time_series(selected_key, datetime_col if datetime_col else None)
 
         excel_data = st.session_state["excel_data"]
-        analyzer = InputDataAnalyzer(excel_data)
+        pipeline = get_pipeline()
 
         selected_key, datetime_col = self.sidebar_controls(excel_data)
-        analyzer.plot_time_series(selected_key, datetime_col if datetime_col else None)
+        values = {
+            "uploaded_bytes": st.session_state["uploaded_bytes"],
+            "selected_key": selected_key,
+            "datetime_col": datetime_col if datetime_col else None,
+            "capacity_factor": st.session_state["capacity_factor"],
+            "consider_cf": st.session_state["consider_cf"],
+            "installed_power_mw": st.session_state["installed_power_mw"],
+        }
+
+        # Grafik yalnızca tablo veya zaman sütunu değişince yeniden çizilir
+        png, warning = pipeline.get("plot", values)
+        if png is None:
+            st.warning(warning)
+        else:
+            st.image(png, use_container_width=True)
+
+        metrics = self.show_generation_metrics(pipeline, values)
+        if metrics is not None:
+            metrics_df, curtailment_ratio, capacity_factor_mechanic, capacity_factor_electricity = metrics
+            st.session_state["curtailment_ratio"] = curtailment_ratio
+            st.session_state["capacity_factor_mechanic"] = capacity_factor_mechanic 
+            st.session_state["capacity_factor_electricity"] = capacity_factor_electricity
 
-        metrics_df, curtailment_ratio, capacity_factor_mechanic, capacity_factor_electricity = self.show_generation_metrics(analyzer, selected_key)
-        st.dataframe(metrics_df)
-        st.session_state["curtailment_ratio"] = curtailment_ratio
-        st.session_state["capacity_factor_mechanic"] = capacity_factor_mechanic 
-        st.session_state["capacity_factor_electricity"] = capacity_factor_electricity
+            st.session_state["capacity_factor_ratio"] = pipeline.get("calibrate", values)
 
-        analyzer.handle_capacity_factor_input(st.session_state["capacity_factor_mechanic"], st.session_state["consider_cf"])
+        show_pipeline_stats()
 
 
 
 # Sayfa çalıştırma
 if __name__ == "__main__":
+    start_pipeline_run()
     page = InputDataAnalysisPage()
     page.run()
@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 import datetime
 
-from utils.input_validation import DataValidator
+from utils.pipeline import get_pipeline, start_pipeline_run
 
 from pathlib import Path
 
@@ -42,6 +42,7 @@ class InputPage:
             "monthly_generation": [],
             "yearly_degradation_rate": None,
             "uploaded_file": None,
+            "uploaded_bytes": None,
             "excel_data": {}
         }
 
@@ -139,6 +140,25 @@ class InputPage:
             | 2     | 1487.68                       |                     |                  |
             """)
 
+        with st.expander("📄 Sayfa 3: Price (Opsiyonel)"):
+            st.markdown("""
+            **Sayfa Adı:** `Price`  
+            Gelir hesabı için tek bir yıla ait saatlik fiyat eğrisi. Her fiyat sütunu bir senaryodur.  
+            Artık yıl değilse 29 Şubat için 28 Şubat fiyatları kullanılır:
+            
+            | Datetime           | Base   | High   |
+            |--------------------|--------|--------|
+            | 2024-01-01 00:00:00| 95.40  | 120.10 |
+            | 2024-01-01 01:00:00| 90.15  | 114.80 |
+            
+            Veya saat x ay formatında (`Scenario` sütunu opsiyoneldir):
+            
+            | Scenario | Hour | 1     | 2     | ... | 12    |
+            |----------|------|-------|-------|-----|-------|
+            | Base     | 0    | 95.40 | 92.10 | ... | 99.00 |
+            | Base     | 1    | 90.15 | 88.70 | ... | 94.30 |
+            """)
+
         st.markdown("📥 Aşağıdaki butona tıklayarak örnek Excel şablonunu indirebilirsiniz:")
         with open("inputs/template_generation_forecast.xlsx", "rb") as file:
             st.download_button(
@@ -152,7 +172,12 @@ class InputPage:
         self.uploaded_file = st.file_uploader("Upload your Excel file", type=["xlsx"])
         if self.uploaded_file:
             try:
-                self.excel_data = pd.read_excel(self.uploaded_file, sheet_name=None)
+                # Dosya değişmediyse ayrıştırma ve doğrulama önbellekten gelir
+                pipeline = get_pipeline()
+                # Aynı bytes nesnesi session_state'e de yazılır; sayfalar arası tekrar özetlenmez
+                self.uploaded_bytes = self.uploaded_file.getvalue()
+                values = {"uploaded_bytes": self.uploaded_bytes}
+                self.excel_data = pipeline.get("parse", values)
                 required_sheets = {"Generation", "Monthly_Total_Generation"}
                 missing_sheets = required_sheets - set(self.excel_data)
                 if missing_sheets:
@@ -166,10 +191,12 @@ class InputPage:
                     monthly_df = self.excel_data["Monthly_Total_Generation"]
                     st.dataframe(monthly_df.head())
 
-                    validator = DataValidator(generation_df = generation_df,monthly_df = monthly_df)
-                    for msg in validator.validate_hourly_generation():
-                        st.success(msg) if "✅" in msg else st.warning(msg) if "🟡" in msg else st.error(msg)
-                    for msg in validator.validate_monthly_total_generation():
+                    price_df = self.excel_data.get("Price")
+                    if price_df is not None:
+                        st.subheader("💰 Price Sheet Validation")
+                        st.dataframe(price_df.head())
+
+                    for msg in pipeline.get("validate", values):
                         st.success(msg) if "✅" in msg else st.warning(msg) if "🟡" in msg else st.error(msg)
 
             except Exception as e:
@@ -186,6 +213,7 @@ class InputPage:
         st.session_state["monthly_generation"] = self.monthly_generation
         st.session_state["yearly_degradation_rate"] = self.yearly_degradation_rate
         # st.session_state["uploaded_file"] = self.uploaded_file
+        st.session_state["uploaded_bytes"] = self.uploaded_bytes
         st.session_state["excel_data"] = self.excel_data
 
 
@@ -204,5 +232,6 @@ class InputPage:
 
 # # Streamlit sayfa çalıştırıcısı
 if __name__ == "__main__" or "pages/1_Data_Upload_and_Validation" in __name__:
+    start_pipeline_run()
     page = InputPage()
     page.run()
@@ -0,0 +1,146 @@
+# backtesting.py
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils.forecasting import GenerationForecaster, MONTH_START_HOURS, ONE_YEAR_MONTHS
+from utils.input_analysis import InputDataAnalyzer
+
+
+class ForecastBacktester:
+    def __init__(self, generation_df: pd.DataFrame, capacity_factor: float = None, consider_cf: bool = False,
+                 installed_power_mw: float = None, yearly_degradation_rate: float = 0.0):
+        """
+        generation_df: çok yıllık gerçekleşen saatlik üretim ('Datetime', 'Generation(MWh)')
+        Kapasite faktörü oranı her pencere için yalnızca o pencerenin eğitim yıllarından hesaplanır.
+        """
+        self.capacity_factor = capacity_factor
+        self.consider_cf = consider_cf
+        self.installed_power_mw = installed_power_mw
+        self.forecaster = GenerationForecaster(1.0, yearly_degradation_rate)
+        self.years, self.profile_matrix = GenerationForecaster.build_yearly_profile_matrix(generation_df)
+
+    def window_count(self, training_years: int, horizon_years: int):
+        return len(self.years) - training_years - horizon_years + 1
+
+    def training_windows(self, training_years: int, horizon_years: int):
+        """
+        Kopyasız kayan eğitim pencereleri, (pencere, 8784, eğitim yılı) şeklinde.
+        """
+        return sliding_window_view(
+            self.profile_matrix[:len(self.years) - horizon_years], training_years, axis=0
+        )
+
+    def build_baselines(self, training_years: int, horizon_years: int):
+        """
+        Tüm kayan eğitim pencereleri için baz profili tek seferde hesaplar.
+        Pencere içindeki her yıl, degradasyon ile pencerenin son yılı seviyesine
+        getirilip saat bazında ortalanır. Sonuç (pencere, 8784) şeklindedir.
+        """
+        windows = self.training_windows(training_years, horizon_years)
+        return self.forecaster.build_baseline(windows, axis=-1)
+
+    def build_capacity_factor_ratios(self, training_years: int, horizon_years: int):
+        """
+        Her pencere için kapasite faktörü oranını tek seferde hesaplar; mekanik
+        kapasite faktörü sadece o pencerenin eğitim yıllarındaki saatlerden bulunur.
+        Oran hesaplanamıyorsa (kapasite faktörü veya kurulu güç girilmemiş,
+        pencerede veri yok) 1 kullanılır.
+        Sonuç (pencere,) şeklindedir.
+        """
+        windows = self.training_windows(training_years, horizon_years)
+        n_windows = windows.shape[0]
+        if self.capacity_factor is None or not self.installed_power_mw:
+            return np.ones(n_windows)
+
+        valid_counts = (~np.isnan(windows)).sum(axis=(-2, -1))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            capacity_factor_mechanic = 100 * np.nansum(windows, axis=(-2, -1)) / (
+                valid_counts * self.installed_power_mw
+            )
+            ratios = InputDataAnalyzer.calculate_capacity_factor_ratio(
+                capacity_factor_mechanic, self.capacity_factor, self.consider_cf
+            )
+        ratios = np.broadcast_to(np.asarray(ratios, dtype=float), (n_windows,))
+        return np.where(np.isfinite(ratios), ratios, 1.0)
+
+    def run(self, training_years: int, horizon_years: int = 1):
+        """
+        Kayan pencerelerle geriye dönük test yapar. Her (pencere, test yılı)
+        için MAE, RMSE, bias ve yıllık enerji hatası ile aylık enerji hatalarını döndürür.
+        """
+        if training_years < 1 or horizon_years < 1:
+            raise ValueError("Training and horizon years must be at least 1.")
+
+        n_windows = self.window_count(training_years, horizon_years)
+        if n_windows < 1:
+            raise ValueError(
+                f"At least {training_years + horizon_years} years of data are required, "
+                f"found {len(self.years)}."
+            )
+
+        baselines = self.build_baselines(training_years, horizon_years)
+        ratios = self.build_capacity_factor_ratios(training_years, horizon_years)
+
+        # (pencere, test yılı, 8784)
+        forecast = self.forecaster.project(baselines * ratios[:, np.newaxis], horizon_years)
+        actual = np.swapaxes(
+            sliding_window_view(self.profile_matrix[training_years:], horizon_years, axis=0), -1, -2
+        )
+
+        error = forecast - actual
+        valid = ~np.isnan(error)
+        valid_counts = valid.sum(axis=-1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mae = np.where(valid, np.abs(error), 0).sum(axis=-1) / valid_counts
+            rmse = np.sqrt(np.where(valid, error ** 2, 0).sum(axis=-1) / valid_counts)
+            bias = np.where(valid, error, 0).sum(axis=-1) / valid_counts
+
+            # Aylık enerji: sadece iki tarafta da verisi olan saatler toplanır
+            forecast_monthly = np.add.reduceat(np.where(valid, forecast, 0), MONTH_START_HOURS, axis=-1)
+            actual_monthly = np.add.reduceat(np.where(valid, actual, 0), MONTH_START_HOURS, axis=-1)
+            monthly_error = 100 * (forecast_monthly - actual_monthly) / actual_monthly
+
+            forecast_annual = forecast_monthly.sum(axis=-1)
+            actual_annual = actual_monthly.sum(axis=-1)
+            annual_error = 100 * (forecast_annual - actual_annual) / actual_annual
+
+        window_index, horizon_index = np.meshgrid(np.arange(n_windows), np.arange(horizon_years), indexing="ij")
+        window_index = window_index.ravel()
+        horizon_index = horizon_index.ravel()
+
+        labels = pd.DataFrame({
+            "Training Years": [
+                f"{self.years[i]}-{self.years[i + training_years - 1]}" for i in window_index
+            ],
+            "Test Year": self.years[window_index + training_years + horizon_index],
+        })
+
+        metrics_df = labels.assign(**{
+            "MAE (MWh)": mae.ravel(),
+            "RMSE (MWh)": rmse.ravel(),
+            "Bias (MWh)": bias.ravel(),
+            "Forecast Energy (MWh)": forecast_annual.ravel(),
+            "Actual Energy (MWh)": actual_annual.ravel(),
+            "Energy Error (%)": annual_error.ravel(),
+        })
+
+        monthly_error_df = pd.concat(
+            [
+                labels,
+                pd.DataFrame(
+                    monthly_error.reshape(-1, ONE_YEAR_MONTHS),
+                    columns=list(range(1, ONE_YEAR_MONTHS + 1)),
+                ),
+            ],
+            axis=1,
+        )
+
+        # Test yılının verisi yoksa (eksik yıl) satır anlamsızdır
+        has_actual = valid_counts.ravel() > 0
+        return (
+            metrics_df[has_actual].reset_index(drop=True),
+            monthly_error_df[has_actual].reset_index(drop=True),
+        )
@@ -0,0 +1,130 @@
+# forecasting.py
+
+import calendar
+
+import numpy as np
+import pandas as pd
+
+# Sabitler
+ONE_YEAR_HOURS = 8784
+ONE_DAY_HOURS = 24
+ONE_YEAR_MONTHS = 12
+
+# Artık yıl şablonunda her ayın başladığı saat indeksi (Ocak, Şubat, ..., Aralık)
+MONTH_START_HOURS = np.array(
+    [0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335]
+) * ONE_DAY_HOURS
+
+# Artık yıl şablonunda 29 Şubat'ın saat indeksleri
+FEB_29_HOURS = np.arange(59 * ONE_DAY_HOURS, 60 * ONE_DAY_HOURS)
+
+
+class GenerationForecaster:
+    def __init__(self, capacity_factor_ratio: float = 1.0, yearly_degradation_rate: float = 0.0):
+        self.capacity_factor_ratio = capacity_factor_ratio
+        self.yearly_degradation_rate = yearly_degradation_rate
+
+    @staticmethod
+    def build_yearly_profile_matrix(generation_df: pd.DataFrame):
+        """
+        Saatlik üretimi (yıl, saat) şeklinde bir matrise çevirir.
+        Her satır 8784 saatlik artık yıl şablonudur; artık olmayan yıllarda
+        29 Şubat saatleri ve eksik kayıtlar NaN olarak kalır. Satırlar ilk ve son
+        yıl arasındaki her takvim yılını kapsar, verisi olmayan yıllar tamamen NaN'dır.
+        """
+        datetimes = pd.DatetimeIndex(pd.to_datetime(generation_df["Datetime"]))
+        values = generation_df["Generation(MWh)"].to_numpy(dtype=float)
+
+        years = np.arange(datetimes.year.min(), datetimes.year.max() + 1)
+        year_index = datetimes.year.to_numpy() - years[0]
+
+        profile_matrix = np.full((len(years), ONE_YEAR_HOURS), np.nan)
+        profile_matrix[year_index, GenerationForecaster.hour_slots(datetimes)] = values
+
+        return years, profile_matrix
+
+    @staticmethod
+    def hour_slots(datetimes: pd.DatetimeIndex):
+        """
+        Her zaman damgasının 8784 saatlik artık yıl şablonundaki indeksini döndürür.
+        """
+        # Artık olmayan yıllarda Mart ve sonrası bir gün kaydırılır
+        day_of_year = datetimes.dayofyear.to_numpy() + (
+            ~datetimes.is_leap_year & (datetimes.month.to_numpy() > 2)
+        )
+        return (day_of_year - 1) * ONE_DAY_HOURS + datetimes.hour.to_numpy()
+
+    def build_baseline(self, year_profiles: np.ndarray, axis: int = 0):
+        """
+        Eskiden yeniye sıralı yıllık profilleri degradasyon ile son yılın
+        seviyesine getirip saat bazında ortalar. NaN saatler ortalamaya katılmaz.
+        """
+        year_profiles = np.moveaxis(year_profiles, axis, -1)
+        year_count = year_profiles.shape[-1]
+        level_factors = (1 - self.yearly_degradation_rate) ** np.arange(year_count - 1, -1, -1)
+        leveled = year_profiles * level_factors
+
+        valid_counts = (~np.isnan(leveled)).sum(axis=-1)
+        sums = np.nansum(leveled, axis=-1)
+        return np.divide(sums, valid_counts, out=np.full(sums.shape, np.nan), where=valid_counts > 0)
+
+    def project(self, baseline_profile: np.ndarray, forecast_year: int):
+        """
+        Baz saatlik profili (..., 8784) kapasite faktörü oranı ve yıllık
+        degradasyon ile ileri taşır. Sonuç (..., forecast_year, 8784) şeklindedir.
+        """
+        degradation = (1 - self.yearly_degradation_rate) ** np.arange(1, forecast_year + 1)
+        return (
+            np.asarray(baseline_profile)[..., np.newaxis, :]
+            * self.capacity_factor_ratio
+            * degradation[:, np.newaxis]
+        )
+
+    @staticmethod
+    def apply_curtailment(generation: np.ndarray, licence_power_mw: float):
+        """
+        Lisans gücünün üstündeki üretimi kırpar. (net üretim, curtailment) döndürür.
+        """
+        net_generation = np.minimum(generation, licence_power_mw)
+        curtailment = generation - net_generation
+        return net_generation, curtailment
+
+    def project_generation(self, generation_df: pd.DataFrame, forecast_year: int, start_year: int):
+        """
+        Curtailment öncesi brüt üretim tahmini, (forecast_year, 8784) şeklinde.
+        Geçmişte artık yıl yoksa baz profilin 29 Şubat saatleri 28 Şubat'tan alınır;
+        böylece artık tahmin yıllarında 29 Şubat üretimi olur. Artık olmayan tahmin
+        yıllarında 29 Şubat saatleri NaN'dır.
+        """
+        _, profile_matrix = self.build_yearly_profile_matrix(generation_df)
+        baseline = self.fill_feb_29(self.build_baseline(profile_matrix))
+        gross_generation = self.project(baseline, forecast_year)
+        return self.mask_non_leap_years(gross_generation, np.arange(start_year, start_year + forecast_year))
+
+    @staticmethod
+    def fill_feb_29(profile: np.ndarray):
+        """
+        (..., 8784) profilde NaN olan 29 Şubat saatlerini 28 Şubat'ın aynı saatleriyle doldurur.
+        """
+        profile = profile.copy()
+        feb_29 = profile[..., FEB_29_HOURS]
+        profile[..., FEB_29_HOURS] = np.where(np.isnan(feb_29), profile[..., FEB_29_HOURS - ONE_DAY_HOURS], feb_29)
+        return profile
+
+    @staticmethod
+    def mask_non_leap_years(generation: np.ndarray, years):
+        """
+        (yıl, 8784) dizisinde artık olmayan yılların 29 Şubat saatlerini NaN yapar.
+        """
+        non_leap = np.array([not calendar.isleap(int(year)) for year in years])
+        generation[np.ix_(non_leap, FEB_29_HOURS)] = np.nan
+        return generation
+
+    @staticmethod
+    def summarize(years, gross_generation, net_generation, curtailment):
+        return pd.DataFrame({
+            "Year": years,
+            "Gross Generation (MWh)": np.nansum(gross_generation, axis=-1),
+            "Net Generation (MWh)": np.nansum(net_generation, axis=-1),
+            "Curtailment (MWh)": np.nansum(curtailment, axis=-1),
+        })
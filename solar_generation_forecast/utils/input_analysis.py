@@ -16,10 +16,21 @@ class InputDataAnalyzer:
         Belirtilen sheet (key) içindeki veriyi zaman serisi olarak çizer.
         datetime_col verilmezse ilk datetime uygun sütun denenir.
         """
-        if key not in self.data:
-            st.warning(f"'{key}' tablosu bulunamadı.")
+        fig, warning = self.build_time_series_figure(key, datetime_col)
+        if fig is None:
+            st.warning(warning)
             return
 
+        st.pyplot(fig)
+
+    def build_time_series_figure(self, key: str, datetime_col: str = None):
+        """
+        Zaman serisi grafiğini oluşturur ama ekrana basmaz.
+        (fig, None) veya çizilemiyorsa (None, uyarı mesajı) döndürür.
+        """
+        if key not in self.data:
+            return None, f"'{key}' tablosu bulunamadı."
+
         df = self.data[key].copy()
 
         # Tarih sütununu otomatik algıla
@@ -28,8 +39,7 @@ class InputDataAnalyzer:
             datetime_col = next((col for col in df.columns if col.lower() in possible_cols), None)
 
         if datetime_col is None or datetime_col not in df.columns:
-            st.warning("⏱ Zaman sütunu bulunamadı. Grafik çizilemiyor.")
-            return
+            return None, "⏱ Zaman sütunu bulunamadı. Grafik çizilemiyor."
 
         df[datetime_col] = pd.to_datetime(df[datetime_col])
         df = df.set_index(datetime_col)
@@ -41,7 +51,9 @@ class InputDataAnalyzer:
         ax.set_ylabel("Değerler")
         ax.grid(True)
 
-        st.pyplot(fig)
+        # pyplot'un tuttuğu referansı bırak; figür yalnızca çağıranda yaşar
+        plt.close(fig)
+        return fig, None
 
     def calculate_generation_metrics(self, generation_df, installed_power_mw, licence_power_mw):
         # Curtailment hesabı
@@ -79,23 +91,19 @@ class InputDataAnalyzer:
         # Hem tabloyu hem de üç rasyoyu ayrı olarak döndür
         return metrics_df, curtailment_ratio, capacity_factor_mechanic, capacity_factor_electricity
 
-    
-    def handle_capacity_factor_input(self,capacity_factor_mechanic,consider_cf):
-
-        if consider_cf == "Hayır":
-            st.session_state["capacity_factor_ratio"] = 1
-            #st.info("📌 Kapasite faktörü hesaba katılmayacak. Oran = 1")
-            return
-
-        try:
-            user_value = float(st.session_state["capacity_factor_ratio"].replace(",", "."))
-            if user_value in [0, 1]:
-                st.session_state["capacity_factor_ratio"] = 1
-                st.info("📌 Varsayılan oran kullanılacak (1)")
-            else:
-                ratio = (user_value * 100) / capacity_factor_mechanic
-                st.session_state["capacity_factor_ratio"] = ratio
-                #st.success(f"✅ Kapasite faktörü oranı: {round(ratio, 3)}")
-        except (ValueError, AttributeError):
-            st.warning("⚠️ Lütfen geçerli bir sayı girin.")
+    @staticmethod
+    def calculate_capacity_factor_mechanic(generation_df, installed_power_mw):
+        total_generation = generation_df["Generation(MWh)"].sum()
+        return 100 * (total_generation / (len(generation_df) * installed_power_mw))
 
+    @staticmethod
+    def calculate_capacity_factor_ratio(capacity_factor_mechanic, capacity_factor, consider_cf):
+        """
+        Tahminde kullanılacak kapasite faktörü oranını döndürür.
+        consider_cf (checkbox) kapalıysa veya capacity_factor (0-1 arası sayı) tam 0 ya da 1 ise
+        oran 1'dir; aksi halde hedef kapasite faktörünün (%) verideki mekanik kapasite
+        faktörüne (%) oranıdır.
+        """
+        if not consider_cf or capacity_factor in [0, 1]:
+            return 1
+        return (capacity_factor * 100) / capacity_factor_mechanic
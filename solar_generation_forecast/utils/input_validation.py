@@ -1,9 +1,12 @@
 import pandas as pd
 
+from utils.revenue import RevenueCalculator
+
 class DataValidator:
-    def __init__(self, generation_df: pd.DataFrame, monthly_df: pd.DataFrame):
+    def __init__(self, generation_df: pd.DataFrame, monthly_df: pd.DataFrame, price_df: pd.DataFrame = None):
         self.generation_df = generation_df
         self.monthly_df = monthly_df
+        self.price_df = price_df
 
     def validate_hourly_generation(self):
         df = self.generation_df
@@ -58,4 +61,27 @@ class DataValidator:
             if df["Licence_Power_MW"][0] == None:
                 messages.append("🟡 Null values found in 'Licence_Power_MW' column.")
 
-        return messages
\ No newline at end of file
+        return messages
+
+    def validate_price_curve(self):
+        df = self.price_df
+        messages = []
+
+        if df is None:
+            messages.append("🟡 No Price sheet provided. Revenue will not be calculated.")
+            return messages
+
+        try:
+            calculator = RevenueCalculator(df)
+        except (ValueError, KeyError, TypeError) as e:
+            messages.append(f"🔴 Invalid Price sheet: {e}")
+            return messages
+
+        messages.append(
+            f"✅ Price sheet is valid ({calculator.shape}, {len(calculator.scenarios)} scenario(s))."
+        )
+
+        if df.isnull().values.any():
+            messages.append("🟡 Null values found in Price sheet. They will be treated as 0.")
+
+        return messages
@@ -0,0 +1,241 @@
+# pipeline.py
+
+import hashlib
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.forecasting import GenerationForecaster
+from utils.input_analysis import InputDataAnalyzer
+from utils.input_validation import DataValidator
+from utils.revenue import RevenueCalculator
+
+
+def fingerprint(value):
+    """
+    Bir değerin değişip değişmediğini anlamak için karşılaştırılabilir bir özet üretir.
+    Tanınmayan nesneler için her çağrıda yeni bir nesne döner; önbellek bu nesneyi
+    tuttuğu sürece sonraki bir özetle asla eşit olmaz, yani değer her seferinde değişmiş sayılır.
+    """
+    if isinstance(value, np.generic):
+        return fingerprint(value.item())
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, bytes):
+        return hashlib.sha1(value).hexdigest()
+    if isinstance(value, np.ndarray):
+        return (value.shape, str(value.dtype), hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest())
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        labels = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        try:
+            return (tuple(map(str, labels)), int(pd.util.hash_pandas_object(value, index=True).sum()))
+        except TypeError:
+            return ("unhashable", object())
+    if isinstance(value, dict):
+        return tuple((key, fingerprint(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(fingerprint(item) for item in value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return ("unhashable", object())
+
+
+class ComputationGraph:
+    def __init__(self):
+        self.stages = {}
+        self.cache = {}
+        self.stats = {}
+        self.begin_run()
+
+    def add_stage(self, name: str, func, inputs: list):
+        """
+        inputs: ham girdi adları veya daha önce eklenmiş aşama adları.
+        func, girdileri bu sırayla pozisyonel argüman olarak alır.
+        """
+        self.stages[name] = {"func": func, "inputs": inputs}
+        self.stats[name] = {"Executed": 0, "Skipped": 0}
+
+    def begin_run(self):
+        """
+        Her script çalıştırmasının başında çağrılır. Aynı çalıştırma içinde aynı
+        girdilerle istenen aşama bir kez çözülür ve istatistiklerde bir kez sayılır.
+        """
+        self.resolved = {}
+        self.raw_fingerprints = {}
+
+    def get(self, name: str, values: dict):
+        """
+        Aşamanın çıktısını döndürür. Girdilerinin özeti önceki çalıştırma ile
+        aynıysa önbellekteki çıktı kullanılır, aksi halde aşama yeniden çalışır.
+        """
+        output, _ = self._resolve(name, values)
+        return output
+
+    def _raw_fingerprint(self, value):
+        # Aynı nesne bu çalıştırmada tekrar özetlenmez; referans tutulduğu için id yeniden kullanılamaz
+        cached = self.raw_fingerprints.get(id(value))
+        if cached is None:
+            cached = self.raw_fingerprints[id(value)] = (value, fingerprint(value))
+        return cached[1]
+
+    def _resolve(self, name, values):
+        stage = self.stages[name]
+
+        args = []
+        key = []
+        for input_name in stage["inputs"]:
+            if input_name in self.stages:
+                output, version = self._resolve(input_name, values)
+                args.append(output)
+                key.append((input_name, version))
+            else:
+                args.append(values[input_name])
+                key.append((input_name, self._raw_fingerprint(values[input_name])))
+        key = tuple(key)
+
+        resolved = self.resolved.get(name)
+        if resolved is not None and resolved["key"] == key:
+            return resolved["output"], resolved["version"]
+
+        cached = self.cache.get(name)
+        if cached is not None and cached["key"] == key:
+            self.stats[name]["Skipped"] += 1
+            self.resolved[name] = cached
+            return cached["output"], cached["version"]
+
+        output = stage["func"](*args)
+        self.stats[name]["Executed"] += 1
+
+        # Çıktı değişmediyse sürüm artmaz, böylece alt aşamalar da atlanır
+        output_fingerprint = fingerprint(output)
+        if cached is not None and cached["output_fingerprint"] == output_fingerprint:
+            version = cached["version"]
+        else:
+            version = 0 if cached is None else cached["version"] + 1
+
+        self.cache[name] = self.resolved[name] = {
+            "key": key,
+            "output": output,
+            "output_fingerprint": output_fingerprint,
+            "version": version,
+        }
+        return output, version
+
+    def stats_frame(self):
+        return pd.DataFrame.from_dict(self.stats, orient="index").rename_axis("Stage").reset_index()
+
+
+def parse_workbook(uploaded_bytes):
+    return pd.read_excel(BytesIO(uploaded_bytes), sheet_name=None)
+
+
+def validate_workbook(excel_data):
+    required_sheets = {"Generation", "Monthly_Total_Generation"}
+    missing_sheets = required_sheets - set(excel_data)
+    if missing_sheets:
+        return [f"🔴 Missing sheet(s): {', '.join(missing_sheets)}"]
+
+    validator = DataValidator(
+        generation_df=excel_data["Generation"],
+        monthly_df=excel_data["Monthly_Total_Generation"],
+        price_df=excel_data.get("Price"),
+    )
+    return (
+        validator.validate_hourly_generation()
+        + validator.validate_monthly_total_generation()
+        + validator.validate_price_curve()
+    )
+
+
+def calculate_metrics(excel_data, selected_key, installed_power_mw, licence_power_mw):
+    df = excel_data[selected_key]
+    if "Generation(MWh)" not in df.columns:
+        return None
+    return InputDataAnalyzer(excel_data).calculate_generation_metrics(df, installed_power_mw, licence_power_mw)
+
+
+def calibrate_capacity_factor(excel_data, installed_power_mw, capacity_factor, consider_cf):
+    df = excel_data.get("Generation")
+    if df is None or "Generation(MWh)" not in df.columns or capacity_factor is None or not installed_power_mw:
+        return 1
+    capacity_factor_mechanic = InputDataAnalyzer.calculate_capacity_factor_mechanic(df, installed_power_mw)
+    return InputDataAnalyzer.calculate_capacity_factor_ratio(capacity_factor_mechanic, capacity_factor, consider_cf)
+
+
+def forecast_generation(excel_data, capacity_factor_ratio, yearly_degradation_rate, forecast_year, start_year):
+    forecaster = GenerationForecaster(capacity_factor_ratio, yearly_degradation_rate)
+    return forecaster.project_generation(excel_data["Generation"], forecast_year, start_year)
+
+
+def curtail_generation(gross_generation, licence_power_mw):
+    return GenerationForecaster.apply_curtailment(gross_generation, licence_power_mw)
+
+
+def aggregate_generation(gross_generation, curtailed, start_year):
+    net_generation, curtailment = curtailed
+    years = np.arange(start_year, start_year + len(gross_generation))
+    return GenerationForecaster.summarize(years, gross_generation, net_generation, curtailment)
+
+
+def calculate_revenue(excel_data, curtailed, summary_df):
+    price_df = excel_data.get("Price")
+    if price_df is None:
+        return None
+    net_generation, curtailment = curtailed
+    return RevenueCalculator(price_df).calculate(net_generation, curtailment, summary_df["Year"].to_numpy())
+
+
+def render_time_series_png(excel_data, selected_key, datetime_col):
+    """
+    Grafiği bir kez PNG'ye çevirir; önbellekte figür yerine bu byte'lar tutulur,
+    böylece yeniden çalıştırmalarda savefig tekrar çağrılmaz.
+    (png, None) veya çizilemiyorsa (None, uyarı mesajı) döndürür.
+    """
+    fig, warning = InputDataAnalyzer(excel_data).build_time_series_figure(selected_key, datetime_col)
+    if fig is None:
+        return None, warning
+
+    # st.pyplot ile aynı ayarlar
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    return buffer.getvalue(), None
+
+
+def build_pipeline():
+    graph = ComputationGraph()
+    graph.add_stage("parse", parse_workbook, ["uploaded_bytes"])
+    graph.add_stage("validate", validate_workbook, ["parse"])
+    graph.add_stage("metrics", calculate_metrics,
+                    ["parse", "selected_key", "metrics_installed_power_mw", "metrics_licence_power_mw"])
+    graph.add_stage("calibrate", calibrate_capacity_factor,
+                    ["parse", "installed_power_mw", "capacity_factor", "consider_cf"])
+    graph.add_stage("forecast", forecast_generation,
+                    ["parse", "calibrate", "yearly_degradation_rate", "forecast_year", "start_year"])
+    graph.add_stage("curtail", curtail_generation, ["forecast", "licence_power_mw"])
+    graph.add_stage("aggregate", aggregate_generation, ["forecast", "curtail", "start_year"])
+    graph.add_stage("revenue", calculate_revenue, ["parse", "curtail", "aggregate"])
+    graph.add_stage("plot", render_time_series_png, ["parse", "selected_key", "datetime_col"])
+    return graph
+
+
+def get_pipeline():
+    """
+    Oturum boyunca aynı hesaplama grafiğini kullanır; önbellek yeniden çalıştırmalar arasında korunur.
+    """
+    if "pipeline" not in st.session_state:
+        st.session_state["pipeline"] = build_pipeline()
+    return st.session_state["pipeline"]
+
+
+def start_pipeline_run():
+    """
+    Script'in en başında bir kez çağrılır.
+    """
+    get_pipeline().begin_run()
+
+
+def show_pipeline_stats():
+    with st.sidebar.expander("⚙️ Pipeline İstatistikleri"):
+        st.dataframe(get_pipeline().stats_frame(), use_container_width=True)
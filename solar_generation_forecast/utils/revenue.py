@@ -0,0 +1,135 @@
+# revenue.py
+
+import numpy as np
+import pandas as pd
+
+from utils.forecasting import (
+    FEB_29_HOURS, GenerationForecaster, MONTH_START_HOURS, ONE_DAY_HOURS, ONE_YEAR_HOURS, ONE_YEAR_MONTHS
+)
+
+MONTH_COLUMNS = [str(month) for month in range(1, ONE_YEAR_MONTHS + 1)]
+
+
+class RevenueCalculator:
+    def __init__(self, price_df: pd.DataFrame):
+        """
+        price_df: 'Price' sayfası. İki formattan biri olmalıdır:
+          - Saatlik: 'Datetime' + her biri bir senaryo olan fiyat sütunları
+          - Saat x Ay: 'Hour' (0-23) + '1'...'12' ay sütunları, opsiyonel 'Scenario'
+        """
+        price_df = price_df.rename(columns=str)
+
+        if "Datetime" in price_df.columns:
+            self.shape = "hourly"
+            self.scenarios, self.prices = self.build_hourly_prices(price_df)
+        elif "Hour" in price_df.columns:
+            self.shape = "hour_month"
+            self.scenarios, self.prices = self.build_hour_month_prices(price_df)
+        else:
+            raise ValueError("Price sheet must contain a 'Datetime' or an 'Hour' column.")
+
+    @staticmethod
+    def build_hourly_prices(price_df: pd.DataFrame):
+        """
+        (senaryo, 8784) fiyat matrisi döndürür. Sayfa tek bir yılın her saatini
+        bir kez içermelidir. Artık olmayan bir yılsa 29 Şubat fiyatları 28 Şubat'tan alınır.
+        """
+        scenarios = [col for col in price_df.columns if col != "Datetime"]
+        if not scenarios:
+            raise ValueError("Price sheet must contain at least one price column.")
+
+        datetimes = pd.DatetimeIndex(pd.to_datetime(price_df["Datetime"]))
+        slots = GenerationForecaster.hour_slots(datetimes)
+
+        repeated = len(slots) - len(np.unique(slots))
+        if repeated:
+            raise ValueError(
+                f"Price sheet must cover a single year with each hour once ({repeated} repeated hour(s) found)."
+            )
+
+        present = np.zeros(ONE_YEAR_HOURS, dtype=bool)
+        present[slots] = True
+        required = np.ones(ONE_YEAR_HOURS, dtype=bool)
+        required[FEB_29_HOURS] = False
+        missing = (required & ~present).sum()
+        if missing:
+            raise ValueError(f"Price sheet is missing {missing} hour(s) of the year.")
+
+        prices = np.zeros((len(scenarios), ONE_YEAR_HOURS))
+        prices[:, slots] = price_df[scenarios].to_numpy(dtype=float).T
+
+        # 29 Şubat yoksa 28 Şubat'ın aynı saatleri kullanılır
+        feb_28_hours = FEB_29_HOURS - ONE_DAY_HOURS
+        prices[:, FEB_29_HOURS] = np.where(present[FEB_29_HOURS], prices[:, FEB_29_HOURS], prices[:, feb_28_hours])
+
+        return scenarios, np.nan_to_num(prices)
+
+    @staticmethod
+    def build_hour_month_prices(price_df: pd.DataFrame):
+        """
+        (senaryo, 12, 24) fiyat matrisi döndürür.
+        """
+        missing = set(MONTH_COLUMNS) - set(price_df.columns)
+        if missing:
+            raise ValueError(f"Missing month columns in Price sheet: {', '.join(sorted(missing, key=int))}")
+
+        if "Scenario" not in price_df.columns:
+            price_df = price_df.assign(Scenario="Price")
+
+        hours = pd.to_numeric(price_df["Hour"], errors="coerce")
+        if hours.isnull().any() or (hours % 1 != 0).any() or not hours.between(0, ONE_DAY_HOURS - 1).all():
+            raise ValueError(f"'Hour' values in Price sheet must be integers between 0 and {ONE_DAY_HOURS - 1}.")
+        hours = hours.to_numpy(dtype=int)
+
+        # Her senaryoda her saat tam olarak bir kez bulunmalı
+        hour_counts = pd.crosstab(price_df["Scenario"], hours).reindex(columns=range(ONE_DAY_HOURS), fill_value=0)
+        invalid_scenarios = hour_counts.index[(hour_counts != 1).any(axis=1)]
+        if len(invalid_scenarios):
+            raise ValueError(
+                "Each hour 0-23 must appear exactly once per scenario in Price sheet "
+                f"(invalid: {', '.join(map(str, invalid_scenarios))})."
+            )
+
+        scenarios = list(pd.unique(price_df["Scenario"]))
+        prices = np.zeros((len(scenarios), ONE_YEAR_MONTHS, ONE_DAY_HOURS))
+        scenario_index = pd.Index(scenarios).get_indexer(price_df["Scenario"])
+        prices[scenario_index, :, hours] = price_df[MONTH_COLUMNS].to_numpy(dtype=float)
+
+        return [str(scenario) for scenario in scenarios], np.nan_to_num(prices)
+
+    def contract(self, generation: np.ndarray):
+        """
+        Üretim (..., 8784) ile fiyatları çarpıp saatler üzerinden toplar.
+        Sonuç (..., senaryo) şeklindedir; fiyat x üretim kopyası oluşturulmaz.
+        """
+        generation = np.nan_to_num(generation)
+
+        if self.shape == "hourly":
+            return generation @ self.prices.T
+
+        # Saatlik üretim önce (ay, günün saati) bazında toplanır
+        daily = generation.reshape(*generation.shape[:-1], -1, ONE_DAY_HOURS)
+        hour_month = np.add.reduceat(daily, MONTH_START_HOURS // ONE_DAY_HOURS, axis=-2)
+        return np.einsum("...mh,smh->...s", hour_month, self.prices)
+
+    def calculate(self, net_generation: np.ndarray, curtailment: np.ndarray, years):
+        """
+        Yıllık gelir, curtailment kaynaklı kayıp gelir ve yakalanan fiyatı hesaplar.
+        net_generation ve curtailment (yıl, 8784) şeklindedir.
+        """
+        revenue = self.contract(net_generation)
+        lost_revenue = self.contract(curtailment)
+        net_energy = np.nansum(net_generation, axis=-1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            capture_price = revenue / net_energy[:, np.newaxis]
+
+        year_count, scenario_count = revenue.shape
+        return pd.DataFrame({
+            "Year": np.repeat(np.asarray(years), scenario_count),
+            "Scenario": np.tile(self.scenarios, year_count),
+            "Net Generation (MWh)": np.repeat(net_energy, scenario_count),
+            "Revenue": revenue.ravel(),
+            "Lost Revenue (Curtailment)": lost_revenue.ravel(),
+            "Capture Price": capture_price.ravel(),
+        })
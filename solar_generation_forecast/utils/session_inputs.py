@@ -0,0 +1,21 @@
+# session_inputs.py
+
+import pandas as pd
+import streamlit as st
+
+
+def get_forecast_inputs():
+    """
+    Tahmin sayfalarının ortak girdilerini session_state'ten okur.
+    Kapasite faktörü oranı burada değil, bu girdilerden hesaplanır.
+    """
+    start_date = st.session_state.get("start_date")
+    return {
+        "capacity_factor": st.session_state.get("capacity_factor"),
+        "consider_cf": bool(st.session_state.get("consider_cf")),
+        "installed_power_mw": st.session_state.get("installed_power_mw") or 0.0,
+        "yearly_degradation_rate": st.session_state.get("yearly_degradation_rate") or 0.0,
+        "forecast_year": int(st.session_state.get("forecast_year") or 1),
+        "licence_power_mw": st.session_state.get("licence_power_mw") or 0.0,
+        "start_year": start_date.year if start_date else pd.Timestamp.today().year,
+    }